@@ -28,10 +28,12 @@ print(repr(service))
 print(service._repr_html_())
 
 
-print(service['CB4_64_16D_STK-1'])
-print(str(service['CB4_64_16D_STK-1']))
-print(repr(service['CB4_64_16D_STK-1']))
-print(service['CB4_64_16D_STK-1']._repr_html_())
+cv = service['CB4_64_16D_STK-1']
+
+print(cv)
+print(str(cv))
+print(repr(cv))
+print(cv._repr_html_())
 
 coverage = service['MOD13Q1-6']
 
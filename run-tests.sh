@@ -17,6 +17,7 @@
 # along with this program. If not, see <https://www.gnu.org/licenses/gpl-3.0.html>.
 #
 
+python -m compileall -q -j0 wtss examples && \
 pydocstyle wtss examples tests setup.py && \
 isort wtss examples tests setup.py --check-only --diff && \
 check-manifest --ignore ".drone.yml,.readthedocs.yml" && \
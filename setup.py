@@ -37,6 +37,7 @@ tests_require = [
     'pytest>=5.2',
     'pytest-cov>=2.8',
     'pytest-pep8>=1.0',
+    'requests-cache>=0.9',
     'pydocstyle>=4.0',
     'isort>4.3',
     'check-manifest>=0.40',
@@ -51,7 +52,8 @@ extras_require = {
     'docs': docs_require,
     'examples': examples_require,
     'tests': tests_require,
-    'matplotlib': ['numpy>=1.13', 'matplotlib>=2.1']
+    'matplotlib': ['numpy>=1.13', 'matplotlib>=2.1'],
+    'fast': ['orjson>=3.0', 'brotli>=1.0'],
 }
 
 extras_require['all'] = [req for _, reqs in extras_require.items() for req in reqs]
@@ -20,32 +20,77 @@
 
 import json
 import os
+from pathlib import Path
 
-import pkg_resources
 import pytest
 
+from wtss import WTSS
 
-@pytest.fixture
+_JSON_DIR = Path(__file__).parent / 'json'
+
+
+def _load_json(filename):
+    """Load a JSON document from the test resources."""
+    return json.loads((_JSON_DIR / filename).read_bytes())
+
+
+@pytest.fixture(scope='session')
 def URL():
     """Return the WTSS URL to be used in tests."""
     return os.getenv('WTSS_TEST_URL', 'http://localhost')
 
 
-@pytest.fixture
+def pytest_addoption(parser):
+    """Register the command-line options of the WTSS test-suite."""
+    parser.addoption('--no-wtss-cache', action='store_true', default=False,
+                     help='Always query the WTSS server instead of replaying cached responses.')
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip the tests that need a WTSS server when ``WTSS_TEST_URL`` is not set."""
+    if os.getenv('WTSS_TEST_URL') is not None:
+        return
+
+    skip = pytest.mark.skip(reason='WTSS_TEST_URL not set')
+
+    for item in items:
+        if 'service' in getattr(item, 'fixturenames', ()):
+            item.add_marker(skip)
+
+
+@pytest.fixture(scope='session')
+def session(request):
+    """Return the HTTP session used by the WTSS client in tests.
+
+    If ``requests-cache`` is installed, the server responses are stored in a
+    local SQLite database and replayed in later runs, unless the option
+    ``--no-wtss-cache`` is given.
+    """
+    if request.config.getoption('--no-wtss-cache'):
+        return None
+
+    try:
+        import requests_cache
+    except ImportError:
+        return None
+
+    return requests_cache.CachedSession('.wtss_test_cache', backend='sqlite',
+                                        expire_after=3600)
+
+
+@pytest.fixture(scope='session')
+def service(URL, session):
+    """Return a WTSS client shared by the tests."""
+    return WTSS(URL, session=session)
+
+
+@pytest.fixture(scope='session')
 def ListCoverageResponse():
     """Return the list of coverages to be validated."""
-    resource_package = __name__
-    doc = pkg_resources.resource_string(resource_package,
-                                        'json/list_coverages_response.json')
+    return _load_json('list_coverages_response.json')
 
-    return json.loads(doc)
 
-
-@pytest.fixture
+@pytest.fixture(scope='session')
 def MOD13Q1():
     """Return the MOD13Q1 metadata."""
-    resource_package = __name__
-    doc = pkg_resources.resource_string(resource_package,
-                                        'json/describe_coverage_response.json')
-
-    return json.loads(doc)
\ No newline at end of file
+    return _load_json('describe_coverage_response.json')
@@ -0,0 +1,129 @@
+#
+# This file is part of Python Client Library for WTSS.
+# Copyright (C) 2022 INPE.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/gpl-3.0.html>.
+#
+
+"""Unit-test for the WTSS command-line interface."""
+
+import os
+
+import pytest
+from click.testing import CliRunner
+
+from wtss import WTSS
+from wtss.cli import _METADATA_CACHE_TTL, cli
+
+
+@pytest.fixture
+def describe_calls(monkeypatch, tmp_path, MOD13Q1):
+    """Keep the CLI cache in a temporary directory and count the coverage descriptions."""
+    monkeypatch.setenv('XDG_CACHE_HOME', str(tmp_path))
+
+    calls = []
+
+    def _describe_coverage(self, name):
+        calls.append(name)
+        return MOD13Q1
+
+    monkeypatch.setattr(WTSS, '_describe_coverage', _describe_coverage)
+
+    return calls
+
+
+def _describe(*args):
+    result = CliRunner().invoke(cli, ['describe', '-u', 'http://localhost', '-c', 'MOD13Q1', *args])
+
+    assert result.exit_code == 0, result.output
+
+    return result
+
+
+def _cache_entries(tmp_path):
+    return list((tmp_path / 'wtss' / 'metadata').glob('*.json'))
+
+
+def test_describe_without_cache(describe_calls, tmp_path):
+    _describe()
+    _describe()
+
+    assert describe_calls == ['MOD13Q1', 'MOD13Q1']
+    assert not (tmp_path / 'wtss').exists()
+
+
+def test_describe_with_cache(describe_calls, tmp_path):
+    first = _describe('--cache')
+
+    assert describe_calls == ['MOD13Q1']
+    assert len(_cache_entries(tmp_path)) == 1
+
+    second = _describe('--cache')
+
+    assert describe_calls == ['MOD13Q1']
+    assert second.output == first.output
+
+
+def test_describe_with_expired_cache(describe_calls, tmp_path):
+    _describe('--cache')
+
+    entry, = _cache_entries(tmp_path)
+
+    expired = entry.stat().st_mtime - _METADATA_CACHE_TTL - 1
+    os.utime(entry, (expired, expired))
+
+    _describe('--cache')
+
+    assert describe_calls == ['MOD13Q1', 'MOD13Q1']
+
+
+def test_describe_with_corrupted_cache(describe_calls, tmp_path):
+    _describe('--cache')
+
+    entry, = _cache_entries(tmp_path)
+    entry.write_text('{"name": "MOD1')
+
+    _describe('--cache')
+
+    assert describe_calls == ['MOD13Q1', 'MOD13Q1']
+    assert _cache_entries(tmp_path) == [entry]
+    assert list(entry.parent.glob('*.tmp')) == []
+
+
+def test_describe_with_unwritable_cache(describe_calls, monkeypatch, tmp_path):
+    not_a_directory = tmp_path / 'cache'
+    not_a_directory.write_text('')
+
+    monkeypatch.setenv('XDG_CACHE_HOME', str(not_a_directory))
+
+    _describe('--cache')
+    _describe('--cache')
+
+    assert describe_calls == ['MOD13Q1', 'MOD13Q1']
+
+
+@pytest.mark.parametrize('cache_home', ['', 'relative/cache'])
+def test_describe_with_invalid_cache_home(describe_calls, monkeypatch, tmp_path, cache_home):
+    home, cwd = tmp_path / 'home', tmp_path / 'cwd'
+    home.mkdir()
+    cwd.mkdir()
+
+    monkeypatch.setenv('HOME', str(home))
+    monkeypatch.setenv('XDG_CACHE_HOME', cache_home)
+    monkeypatch.chdir(cwd)
+
+    _describe('--cache')
+
+    assert len(_cache_entries(home / '.cache')) == 1
+    assert list(cwd.iterdir()) == []
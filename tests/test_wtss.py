@@ -18,25 +18,32 @@
 
 """Unit-test for the WTSS Python Client Library for."""
 
+import copy
+import pickle
+import subprocess
+import sys
+import threading
+import time
+from datetime import date
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
 import pytest
 from requests import ConnectionError as _ConnectionError
+from requests import HTTPError
 
-from wtss import *
+from wtss import WTSS, Coverage, TimeSeries
+from wtss.utils import _MAX_CONCURRENT_REQUESTS, to_datetime
 
 
 @pytest.mark.xfail(raises=_ConnectionError,
                     reason='WTSS server not reached!')
-def test_list_coverages(URL, ListCoverageResponse):
-    service = WTSS(URL)
-
+def test_list_coverages(service, ListCoverageResponse):
     assert set(service.coverages) == set(ListCoverageResponse['coverages'])
 
 
 @pytest.mark.xfail(raises=_ConnectionError,
                     reason='WTSS server not reached!')
-def test_describe_coverage(URL, MOD13Q1):
-    service = WTSS(URL)
-
+def test_describe_coverage(service, MOD13Q1):
     cov = service['MOD13Q1']
 
     assert cov.name == MOD13Q1['name']
@@ -60,13 +67,278 @@ def test_describe_coverage(URL, MOD13Q1):
          ])
     ]
 )
-def test_st(URL, coverage, attr, location, start_date, end_date, result):
-    service = WTSS(URL)
-
+def test_st(service, coverage, attr, location, start_date, end_date, result):
     cov = service[coverage]
 
     ts = cov.ts(attributes=attr,
                 latitude=location['latitude'], longitude=location['longitude'],
                 start_date=start_date, end_date=end_date)
 
-    assert ts.values(attr) == result
\ No newline at end of file
+    assert ts.values(attr) == result
+
+
+def test_import_does_not_load_plotting_libraries():
+    code = 'import sys; from wtss import *; ' \
+           'print(any(m in sys.modules for m in ("matplotlib", "numpy")))'
+
+    out = subprocess.check_output([sys.executable, '-c', code], text=True)
+
+    assert out.strip() == 'False'
+
+
+def test_coverage_html_follows_metadata_changes(URL, MOD13Q1):
+    cv = Coverage(service=WTSS(URL), metadata=MOD13Q1)
+
+    assert MOD13Q1['name'] in cv._repr_html_()
+
+    cv.update(name='RENAMED')
+
+    assert 'RENAMED' in cv._repr_html_()
+
+
+def test_ts_queries_the_current_attributes(monkeypatch, URL, MOD13Q1):
+    service = WTSS(URL)
+
+    queries = []
+    monkeypatch.setattr(service, '_time_series', lambda **options: queries.append(options) or {})
+
+    cv = Coverage(service=service, metadata=MOD13Q1)
+    cv.ts(latitude=-12.0, longitude=-54.0)
+
+    cv.update(attributes=[dict(name='nir')])
+    cv.ts(latitude=-12.0, longitude=-54.0)
+
+    assert queries[0]['attributes'] == ','.join(attr['name'] for attr in MOD13Q1['attributes'])
+    assert queries[1]['attributes'] == 'nir'
+
+
+class _UnavailableHandler(BaseHTTPRequestHandler):
+    """Answer every request with a 503 Service Unavailable, asking to retry in an hour."""
+
+    def do_GET(self):
+        self.send_response(503)
+        self.send_header('Retry-After', '3600')
+        self.send_header('Content-Length', '0')
+        self.end_headers()
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def unavailable_server():
+    """Run a local HTTP server that is always unavailable and return its URL."""
+    server = HTTPServer(('127.0.0.1', 0), _UnavailableHandler)
+
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    yield f'http://127.0.0.1:{server.server_port}'
+
+    server.shutdown()
+    server.server_close()
+
+
+def test_unavailable_server_raises_http_error(unavailable_server):
+    start = time.monotonic()
+
+    with pytest.raises(HTTPError) as exc_info:
+        WTSS(unavailable_server).coverages
+
+    assert exc_info.value.response.status_code == 503
+
+    # the Retry-After header of one hour must not be honored
+    assert time.monotonic() - start < 60
+
+
+def test_to_datetime():
+    assert to_datetime(['2001-01-01', '2001-1-17']) == [date(2001, 1, 1), date(2001, 1, 17)]
+    assert to_datetime(['17/01/2001'], fmt='%d/%m/%Y') == [date(2001, 1, 17)]
+
+
+@pytest.mark.parametrize('value', ['20010101', '2001-W01-1', '2001-02-30', '2001-01-01T00:00'])
+def test_to_datetime_rejects_other_formats(value):
+    with pytest.raises(ValueError):
+        to_datetime([value])
+
+
+@pytest.fixture
+def time_series():
+    """Return a time series built offline."""
+    data = dict(result=dict(timeline=['2001-01-01', '2001-01-17'],
+                            attributes=[dict(attribute='red', values=[236.0, 289.0]),
+                                        dict(attribute='nir', values=[3463.0, 3656.0])]))
+
+    return TimeSeries(Coverage(service=None, metadata=dict(name='MOD13Q1')), data)
+
+
+def test_time_series_attributes(time_series):
+    assert time_series.attributes == ['red', 'nir']
+    assert time_series.timeline == ['2001-01-01', '2001-01-17']
+
+    assert time_series.red == time_series.values('red') == [236.0, 289.0]
+    assert time_series.nir == time_series.values('nir') == [3463.0, 3656.0]
+
+
+def test_time_series_unknown_attribute(time_series):
+    with pytest.raises(AttributeError):
+        time_series.blue
+
+    with pytest.raises(AttributeError):
+        time_series.values('blue')
+
+    assert not hasattr(time_series, 'blue')
+    assert not hasattr(time_series, '_blue')
+    assert not hasattr(time_series, '__blue__')
+
+
+@pytest.mark.parametrize('clone', [copy.copy, copy.deepcopy,
+                                   lambda ts: pickle.loads(pickle.dumps(ts))])
+def test_time_series_clone(time_series, clone):
+    before_access = clone(time_series)
+
+    time_series.red  # build the values of each attribute
+
+    after_access = clone(time_series)
+
+    for other in (before_access, after_access):
+        assert other == time_series
+        assert other.attributes == ['red', 'nir']
+        assert other.red == [236.0, 289.0]
+        assert other.values('nir') == [3463.0, 3656.0]
+        assert other._coverage.name == 'MOD13Q1'
+
+
+@pytest.mark.parametrize('latitude, longitude', [(True, False), (-12.0, True), ('-12', -54.0)])
+def test_ts_rejects_non_numeric_location(MOD13Q1, latitude, longitude):
+    cv = Coverage(service=None, metadata=MOD13Q1)
+
+    with pytest.raises(ValueError, match='must be numeric'):
+        cv.ts(latitude=latitude, longitude=longitude)
+
+
+@pytest.fixture
+def stub_service(monkeypatch, URL):
+    """Return a WTSS client with 20 coverages that records the coverages described."""
+    service = WTSS(URL)
+
+    names = [f'CV-{i:02d}' for i in range(20)]
+    described = []
+
+    def _describe_coverage(name):
+        # describe the first coverages slower to shuffle the completion order
+        time.sleep(0.01 * (len(names) - names.index(name)) / len(names))
+        described.append(name)
+        return dict(name=name)
+
+    monkeypatch.setattr(service, '_list_coverages', lambda: names)
+    monkeypatch.setattr(service, '_describe_coverage', _describe_coverage)
+
+    return service, names, described
+
+
+def test_iter_keeps_coverages_order(stub_service):
+    service, names, described = stub_service
+
+    assert [cv.name for cv in service] == names
+    assert sorted(described) == names
+
+
+def test_iter_stops_describing_early(stub_service):
+    service, names, described = stub_service
+
+    coverages = iter(service)
+
+    assert next(coverages).name == names[0]
+
+    coverages.close()
+
+    assert len(described) <= _MAX_CONCURRENT_REQUESTS + 1
+
+
+@pytest.fixture
+def pyplot(monkeypatch):
+    """Return matplotlib.pyplot with a non-interactive backend and show() disabled."""
+    matplotlib = pytest.importorskip('matplotlib')
+    pytest.importorskip('numpy')
+
+    matplotlib.use('Agg')
+
+    import matplotlib.pyplot as plt
+
+    monkeypatch.setattr(plt, 'show', lambda: None)
+
+    yield plt
+
+    plt.close('all')
+
+
+def test_time_series_plot_without_attributes(time_series, pyplot):
+    time_series.plot(attributes=[])
+
+    assert pyplot.gca().get_lines() == []
+
+
+def test_time_series_plot(pyplot):
+    import numpy as np
+
+    coverage = Coverage(service=None,
+                        metadata=dict(name='MOD13Q1',
+                                      attributes=[dict(name='red', missing_value=-3000),
+                                                  dict(name='nir')]))
+
+    data = dict(result=dict(timeline=['2001-01-01', '2001-01-17', '2001-02-02'],
+                            attributes=[dict(attribute='red', values=[236.0, -3000.0, 289.0]),
+                                        dict(attribute='nir', values=[3463.0, 3656.0, -3000.0])]))
+
+    TimeSeries(coverage, data).plot()
+
+    red, nir = pyplot.gca().get_lines()
+
+    assert (red.get_label(), nir.get_label()) == ('red', 'nir')
+
+    for line in (red, nir):
+        assert np.asarray(line.get_xdata()).dtype.kind == 'M'
+
+    # only the attribute declaring the nodata value is masked
+    np.testing.assert_array_equal(red.get_ydata(), [236.0, np.nan, 289.0])
+    np.testing.assert_array_equal(nir.get_ydata(), [3463.0, 3656.0, -3000.0])
+
+
+def test_ts_many_keeps_points_order(monkeypatch, URL, MOD13Q1):
+    service = WTSS(URL)
+
+    def _time_series(latitude, longitude, **options):
+        # answer the first points slower to shuffle the completion order
+        time.sleep(0.01 * (10 + latitude) / 10)
+        return dict(latitude=latitude, longitude=longitude)
+
+    monkeypatch.setattr(service, '_time_series', _time_series)
+
+    points = [(-float(i), -54.0) for i in range(10)]
+
+    ts_list = Coverage(service=service, metadata=MOD13Q1).ts_many(points, attributes='nir')
+
+    assert [(ts['latitude'], ts['longitude']) for ts in ts_list] == points
+
+
+@pytest.mark.parametrize('location', [dict(latitude=-12.0), dict(longitude=-54.0)])
+def test_ts_many_rejects_location_options(MOD13Q1, location):
+    cv = Coverage(service=None, metadata=MOD13Q1)
+
+    with pytest.raises(ValueError, match='points'):
+        cv.ts_many([(-12.0, -54.0)], **location)
+
+
+def test_refresh_describes_coverages_again(stub_service):
+    service, names, described = stub_service
+
+    cv = service[names[0]]
+
+    assert service[names[0]] is cv
+    assert described == [names[0]]
+
+    service.refresh()
+
+    assert service[names[0]] is not cv
+    assert described == [names[0], names[0]]
@@ -16,13 +16,13 @@
 # along with this program. If not, see <https://www.gnu.org/licenses/gpl-3.0.html>.
 #
 
-"""Python Client Library for WTSS."""
+"""Python Client Library for WTSS.
 
-from .coverage import Coverage
+The public classes are resolved on first access (:pep:`562`), so a plain
+``import wtss`` does not pay for importing ``requests`` and ``jinja2``.
+"""
 
-from.timeseries import TimeSeries
 from .version import __version__
-from .wtss import WTSS
 
 __all__ = (
     '__version__',
@@ -30,3 +30,25 @@ __all__ = (
     'TimeSeries',
     'WTSS',
 )
+
+
+def __getattr__(name):
+    """Import the public classes lazily."""
+    if name == 'WTSS':
+        from .wtss import WTSS
+        return WTSS
+
+    if name == 'Coverage':
+        from .coverage import Coverage
+        return Coverage
+
+    if name == 'TimeSeries':
+        from .timeseries import TimeSeries
+        return TimeSeries
+
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+
+def __dir__():
+    """List the public names of the package, including the lazy ones."""
+    return sorted(set(globals()) | set(__all__))
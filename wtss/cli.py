@@ -18,10 +18,75 @@
 
 """Command-Line Interface for BDC database management."""
 
+import hashlib
+import json
+import os
+import tempfile
+import time
+from pathlib import Path
+
 import click
 
+from .coverage import Coverage
 from .wtss import WTSS
 
+#: int: Number of seconds a cached coverage metadata remains valid.
+_METADATA_CACHE_TTL = 3600
+
+
+def _get_coverage(service, name, cache=False):
+    """Get a coverage from the service, optionally through an on-disk cache.
+
+    The cache is stored under ``$XDG_CACHE_HOME/wtss/metadata`` (``~/.cache``
+    if unset or not an absolute path), so that scripts invoking the CLI many
+    times for the same coverage only describe it once per
+    :data:`_METADATA_CACHE_TTL` seconds.
+    """
+    if not cache:
+        return service[name]
+
+    key = f'{service._url}\n{name}\n{service._access_token}'.encode('utf-8')
+
+    cache_home = os.getenv('XDG_CACHE_HOME')
+
+    # An empty or relative XDG_CACHE_HOME is invalid and must be ignored.
+    if not cache_home or not os.path.isabs(cache_home):
+        cache_home = Path.home() / '.cache'
+
+    cache_dir = Path(cache_home) / 'wtss' / 'metadata'
+
+    path = cache_dir / f'{hashlib.sha1(key).hexdigest()}.json'
+
+    try:
+        if (time.time() - path.stat().st_mtime) < _METADATA_CACHE_TTL:
+            return Coverage(service=service, metadata=json.loads(path.read_text()))
+    except (OSError, ValueError):
+        # A missing, unreadable or corrupted entry is just a cache miss.
+        pass
+
+    cv = service[name]
+
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+
+        # Write to a temporary file first and move it into place, so that CLI
+        # invocations running in parallel never read a partially written entry.
+        fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix='.tmp')
+
+        try:
+            with os.fdopen(fd, 'w') as f:
+                json.dump(cv, f)
+
+            os.replace(tmp_path, path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+    except OSError:
+        # The metadata is already at hand, so failing to cache it is harmless.
+        pass
+
+    return cv
+
 
 @click.group()
 @click.version_option()
@@ -66,7 +131,9 @@ def list_coverages(verbose, url, access_token=None):
               help='Coverage name')
 @click.option('--access-token', required=False, type=str,
               help='User Personal Access Token.')
-def describe(verbose, url, coverage, access_token=None):
+@click.option('--cache', is_flag=True, default=False,
+              help='Cache the coverage metadata on disk for one hour.')
+def describe(verbose, url, coverage, access_token=None, cache=False):
     """Retrieve the coverage metadata."""
     if verbose:
         click.secho(f'Server: {url}', bold=True, fg='black')
@@ -75,7 +142,7 @@ def describe(verbose, url, coverage, access_token=None):
 
     service = WTSS(url, access_token=access_token)
 
-    cv = service[coverage]
+    cv = _get_coverage(service, coverage, cache=cache)
 
     click.secho(f'\t- {cv}', bold=True, fg='green')
 
@@ -101,8 +168,10 @@ def describe(verbose, url, coverage, access_token=None):
               help='End date')
 @click.option('--access-token', required=False, type=str,
               help='User Personal Access Token.')
+@click.option('--cache', is_flag=True, default=False,
+              help='Cache the coverage metadata on disk for one hour.')
 def ts(verbose, url, coverage, attributes,
-       latitude, longitude, start_date, end_date, access_token=None):
+       latitude, longitude, start_date, end_date, access_token=None, cache=False):
     """Retrieve the coverage metadata."""
     if verbose:
         click.secho(f'Server: {url}', bold=True, fg='black')
@@ -111,7 +180,11 @@ def ts(verbose, url, coverage, attributes,
 
     service = WTSS(url, access_token=access_token)
 
-    cv = service[coverage]
+    if attributes and start_date and end_date:
+        # The coverage metadata is only needed to fill in the missing arguments.
+        cv = Coverage(service=service, metadata=dict(name=coverage))
+    else:
+        cv = _get_coverage(service, coverage, cache=cache)
 
     ts = cv.ts(latitude=latitude, longitude=longitude,
                attributes=attributes, start_date=start_date, end_date=end_date)
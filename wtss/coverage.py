@@ -18,8 +18,18 @@
 
 """A class that represents a coverage in WTSS."""
 
-from .timeseries import TimeSeries
-from .utils import render_html
+from .utils import _MAX_CONCURRENT_REQUESTS, render_html
+
+#: tuple: The types accepted for latitude and longitude values.
+_NUMERIC_TYPES = (float, int)
+
+
+def _is_numeric(value):
+    """Check if a value is accepted as a latitude or longitude.
+
+    Note that ``bool`` is a subclass of ``int``, but it is not a coordinate.
+    """
+    return isinstance(value, _NUMERIC_TYPES) and not isinstance(value, bool)
 
 
 class Coverage(dict):
@@ -129,39 +139,98 @@ class Coverage(dict):
                 >>> ts.red
                 [236.0, 289.0, ..., 494.0, 1349.0]
         """
-        attributes = options['attributes'] \
-                        if 'attributes' in options and options['attributes'] \
-                            else [attr['name'] for attr in self.attributes]
+        attributes = options.get('attributes')
 
-        if not isinstance(attributes, str):
+        if not attributes:
+            attributes = ','.join(attr['name'] for attr in self.attributes)
+        elif not isinstance(attributes, str):
             attributes = ','.join(attributes)
 
-        if ('latitude' not in options) or ('longitude' not in options):
-            raise ValueError("Arguments latitude and longitude are mandatory.")
+        latitude = options.get('latitude')
+        longitude = options.get('longitude')
 
-        latitude = options['latitude']
-        longitude = options['longitude']
+        if (latitude is None) or (longitude is None):
+            raise ValueError("Arguments latitude and longitude are mandatory.")
 
-        if (type(latitude) not in (float, int)) or (type(longitude) not in (float, int)):
+        if not _is_numeric(latitude) or not _is_numeric(longitude):
             raise ValueError("Arguments latitude and longitude must be numeric.")
 
-        if (latitude < -90.0) or (latitude > 90.0):
+        if not -90.0 <= latitude <= 90.0:
             raise ValueError('latitude is out-of range [-90,90]!')
 
-        if (longitude < -180.0) or (longitude > 180.0):
+        if not -180.0 <= longitude <= 180.0:
             raise ValueError('longitude is out-of range [-180,180]!')
 
-        start_date = options['start_date'] if ('start_date' in options) else self.timeline[0]
+        start_date = options.get('start_date') or self.timeline[0]
 
-        end_date = options['end_date'] if ('end_date' in options) else self.timeline[-1]
+        end_date = options.get('end_date') or self.timeline[-1]
 
         data = self._service._time_series(coverage=self.name, attributes=attributes,
                                           longitude=longitude, latitude=latitude,
                                           start_date=start_date, end_date=end_date)
 
+        from .timeseries import TimeSeries
+
         return TimeSeries(self, data)
 
 
+    def ts_many(self, points, **options):
+        """Retrieve the time series for several locations.
+
+        The requests are issued concurrently over the connections of the
+        WTSS client session.
+
+        Args:
+            points (sequence): A sequence of ``(latitude, longitude)`` pairs.
+
+        Keyword Args:
+            attributes (optional): A string with attribute names separated by commas,
+                or any sequence of strings. If omitted, the values for all
+                coverage attributes are retrieved.
+            start_date (:obj:`str`, optional): The begin of a time interval.
+            end_date (:obj:`str`, optional): The begin of a time interval.
+
+        Returns:
+            list: A :class:`TimeSeries` for each location, in the same order as ``points``.
+
+        Raises:
+            HTTPError: If the server response indicates an error.
+            ValueError: If the response body is not a json document, a
+                location is not valid or ``latitude``/``longitude`` are
+                given as keyword arguments.
+
+        Example:
+
+            Retrieves the time series of two locations for MODIS13Q1 data product:
+
+            .. doctest::
+                :skipif: WTSS_EXAMPLE_URL is None
+
+                >>> from wtss import *
+                >>> service = WTSS(WTSS_EXAMPLE_URL)
+                >>> coverage = service['MOD13Q1']
+                >>> ts_list = coverage.ts_many([(-12.0, -54.0), (-12.5, -54.5)],
+                ...                            attributes=('red', 'nir'),
+                ...                            start_date='2001-01-01', end_date='2001-12-31')
+                ...
+                >>> len(ts_list)
+                2
+        """
+        if 'latitude' in options or 'longitude' in options:
+            raise ValueError('The locations must be given in points, '
+                             'not as latitude and longitude arguments.')
+
+        from concurrent.futures import ThreadPoolExecutor
+
+        def _ts(point):
+            latitude, longitude = point
+
+            return self.ts(latitude=latitude, longitude=longitude, **options)
+
+        with ThreadPoolExecutor(max_workers=_MAX_CONCURRENT_REQUESTS) as executor:
+            return list(executor.map(_ts, points))
+
+
     def __str__(self):
         """Return the string representation of the Coverage object."""
         return super().__str__()
@@ -177,8 +246,8 @@ class Coverage(dict):
 
 
     def _repr_pretty_(self, p, cycle):
-        """Customize how the REPL pretty-prints WTSS."""
-        return self._repr_html_()
+        """Customize how the REPL pretty-prints a coverage."""
+        p.text('Coverage(...)' if cycle else str(self))
 
 
     def _repr_html_(self):
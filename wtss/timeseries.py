@@ -38,17 +38,29 @@ class TimeSeries(dict):
         #: Coverage: The associated coverage.
         self._coverage = coverage
 
+        #: dict: The values of each attribute, built on first access.
+        self._values = None
+
+        #: numpy.ndarray: The timeline as datetime64 values, built on first plot.
+        self._dates = None
+
         super(TimeSeries, self).__init__(data or {})
 
-        # add coverage attributes as object keys
-        attrs = self['result']['attributes']
 
-        for attr in attrs:
-            setattr(self, attr['attribute'], attr['values'])
+    def __getattr__(self, name):
+        """Return the values of the attribute identified by name.
+
+        Raises:
+            AttributeError: If the time series has no attribute with the given name.
+        """
+        if name.startswith('_'):
+            raise AttributeError(name)
+
+        return self.values(name)
 
 
     @property
-    def timeline(self, as_date=False, fmt=''):
+    def timeline(self):
         """Return the timeline associated to the time series."""
         return self['result']['timeline']
 
@@ -56,14 +68,28 @@ class TimeSeries(dict):
     @property
     def attributes(self):
         """Return a list with attribute names."""
-        attributes = [attr['attribute'] for attr in self['result']['attributes']]
-
-        return attributes
+        return list(self._attribute_values())
 
 
     def values(self, attr_name):
-        """Return the time series for the given attribute."""
-        return getattr(self, attr_name)
+        """Return the time series for the given attribute.
+
+        Raises:
+            AttributeError: If the time series has no attribute with the given name.
+        """
+        try:
+            return self._attribute_values()[attr_name]
+        except KeyError:
+            raise AttributeError(f'No attribute named "{attr_name}"')
+
+
+    def _attribute_values(self):
+        """Return the values of each attribute, indexed by the attribute name."""
+        if self._values is None:
+            self._values = {attr['attribute']: attr['values']
+                            for attr in self['result']['attributes']}
+
+        return self._values
 
 
     def plot(self, **options):
@@ -110,8 +136,8 @@ class TimeSeries(dict):
         try:
             import matplotlib.pyplot as plt
             import numpy as np
-        except:
-            raise ImportError('You should install Matplotlib and Numpy!')
+        except ImportError as e:
+            raise ImportError('You should install Matplotlib and Numpy!') from e
 
         fig, ax = plt.subplots()
 
@@ -120,20 +146,32 @@ class TimeSeries(dict):
         plt.xlabel('Date', fontsize=16)
         plt.ylabel('Surface Reflectance', fontsize=16)
 
-        x = self.timeline
+        if self._dates is None:
+            self._dates = np.asarray(self.timeline, dtype='datetime64')
 
-        plt.xticks(np.linspace(0, len(x), num=10))
+        x = self._dates
 
         attrs = options['attributes'] if 'attributes' in options else self.attributes
 
-        for attr in attrs:
-            y = self.values(attr)
+        # with no attributes there is nothing to stack, just draw the empty axes
+        if attrs:
+            y = np.array([self.values(attr) for attr in attrs], dtype=np.float32)
+
+            # hide the samples holding the nodata value of each attribute
+            nodata = {attr['name']: attr.get('missing_value')
+                      for attr in self._coverage.get('attributes', [])}
+
+            missing = np.array([nodata.get(attr) for attr in attrs], dtype=np.float32)
+
+            y[y == missing[:, np.newaxis]] = np.nan
+
+            lines = ax.plot(x, y.T,
+                            ls='-',
+                            marker='o',
+                            linewidth=1.0)
 
-            ax.plot(x, y,
-                    ls='-',
-                    marker='o',
-                    linewidth=1.0,
-                    label=attr)
+            for line, attr in zip(lines, attrs):
+                line.set_label(attr)
 
         plt.legend()
 
@@ -146,7 +184,7 @@ class TimeSeries(dict):
 
     def _repr_pretty_(self, p, cycle):
         """Customize how the REPL pretty-prints a time series."""
-        return self._repr_html_()
+        p.text('TimeSeries(...)' if cycle else str(self))
 
 
     def _repr_html_(self):
@@ -18,20 +18,36 @@
 
 """Utility functions for WTSS client library."""
 
-from datetime import datetime
+from datetime import date, datetime
+from functools import lru_cache
 
-import jinja2
-from pkg_resources import resource_filename
+#: int: Maximum number of simultaneous requests issued to a WTSS server.
+_MAX_CONCURRENT_REQUESTS = 8
 
-_template_loader = jinja2.FileSystemLoader(searchpath=resource_filename(__name__, 'templates/'))
 
-_template_env = jinja2.Environment(loader=_template_loader,
-                                   autoescape=jinja2.select_autoescape(['html']))
+@lru_cache(maxsize=None)
+def _template_env():
+    """Create the Jinja2 environment used to render the HTML templates.
+
+    The environment is only built on the first rendering, since importing
+    ``jinja2`` and ``pkg_resources`` is expensive and most scripts never
+    display a rich representation.
+    """
+    import jinja2
+    from pkg_resources import resource_filename
+
+    loader = jinja2.FileSystemLoader(searchpath=resource_filename(__name__, 'templates/'))
+
+    # The templates are package data, so there is no need to check them for
+    # changes on disk every time they are rendered.
+    return jinja2.Environment(loader=loader,
+                              autoescape=jinja2.select_autoescape(['html']),
+                              auto_reload=False)
 
 
 def render_html(template_name, **kwargs):
     """Render Jinja2 HTML template."""
-    template = _template_env.get_template(template_name)
+    template = _template_env().get_template(template_name)
     return template.render(**kwargs)
 
 
@@ -45,6 +61,17 @@ def to_datetime(timeline, fmt='%Y-%m-%d'):
     Returns:
         list (datetime): a timeline with datetime values.
     """
-    date_timeline = [datetime.strptime(t, fmt).date() for t in timeline]
+    date_timeline = [_to_date(t, fmt) for t in timeline]
+
+    return date_timeline
+
+
+def _to_date(t, fmt):
+    """Convert a string to a date according to the given format."""
+    # date.fromisoformat is implemented in C and much faster than strptime,
+    # but since Python 3.11 it also accepts other ISO 8601 forms, such as
+    # '20010101'. So, it only handles strings shaped as YYYY-MM-DD.
+    if fmt == '%Y-%m-%d' and len(t) == 10 and t[4] == t[7] == '-':
+        return date.fromisoformat(t)
 
-    return date_timeline
\ No newline at end of file
+    return datetime.strptime(t, fmt).date()
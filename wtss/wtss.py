@@ -39,28 +39,73 @@ of ``January 1st, 2001`` and ``December 31st, 2003``:
         ...
 """
 
+from collections import deque
+from functools import lru_cache
+from itertools import islice
+
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from .coverage import Coverage
-from .utils import render_html
+from .utils import _MAX_CONCURRENT_REQUESTS, render_html
+
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
+
+@lru_cache(maxsize=None)
+def _default_session():
+    """Return the HTTP session shared by all WTSS clients in the process.
+
+    The session keeps the connections alive, so that consecutive requests to
+    the same server reuse the TCP and TLS handshakes. Requests answered with
+    502, 503 or 504 are retried up to three times with a short exponential
+    backoff. A ``Retry-After`` header is not honored, since it could block
+    the client for hours.
+    """
+    # Once the retries are exhausted the last response is returned, so that
+    # raise_for_status() still reports the failure as an HTTPError.
+    retry = Retry(total=3, backoff_factor=0.2, status_forcelist=(502, 503, 504),
+                  raise_on_status=False, respect_retry_after_header=False)
+
+    adapter = HTTPAdapter(pool_connections=4,
+                          pool_maxsize=_MAX_CONCURRENT_REQUESTS,
+                          max_retries=retry)
+
+    session = requests.Session()
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+
+    return session
 
 
 class WTSS:
     """Implement a client for WTSS.
 
+    The metadata of each coverage is retrieved from the server only once per
+    client, and the same :class:`~wtss.coverage.Coverage` object is returned by
+    further lookups. Since the timeline of a coverage grows as new images are
+    published, long-lived clients should call :meth:`refresh` to pick up
+    the current metadata.
+
     .. note::
 
         For more information about coverage definition, please, refer to
         `WTSS specification <https://github.com/brazil-data-cube/wtss-spec>`_.
     """
 
-    def __init__(self, url, validate=False, access_token=None):
+    def __init__(self, url, validate=False, access_token=None, session=None):
         """Create a WTSS client attached to the given host address (an URL).
 
         Args:
             url (str): URL for the WTSS server.
             validate (bool, optional): If True the client will validate the server response.
             access_token (str, optional): Authentication token to be used with the WTSS server.
+            session (requests.Session, optional): HTTP session used to query the server.
+                If omitted, a session shared by all clients in the process is used.
         """
         #: str: URL for the WTSS server.
         self._url = url
@@ -71,6 +116,12 @@ class WTSS:
         #: str: Authentication token to be used with the WTSS server.
         self._access_token = access_token
 
+        #: requests.Session: HTTP session used to talk to the WTSS server.
+        self._session = session or _default_session()
+
+        #: dict: Coverages already described by the server, indexed by name.
+        self._coverages = dict()
+
     @property
     def coverages(self):
         """Return a list of coverage names.
@@ -146,9 +197,20 @@ class WTSS:
 
         return ts
 
+    def refresh(self):
+        """Discard the coverages already described by the server.
+
+        The following lookups retrieve the coverage metadata from the server
+        again. Coverage objects obtained before remain unchanged.
+        """
+        self._coverages.clear()
+
     def __getitem__(self, key):
         """Get coverage whose name is identified by the key.
 
+        The coverage metadata is retrieved from the server only once, further
+        lookups return the same coverage object until :meth:`refresh` is called.
+
         Returns:
             Coverage: A coverage metadata object.
 
@@ -169,9 +231,12 @@ class WTSS:
                 >>> service['MOD13Q1']
                 Coverage...
         """
-        cv_meta = self._describe_coverage(key)
+        if key not in self._coverages:
+            cv_meta = self._describe_coverage(key)
+
+            self._coverages[key] = Coverage(service=self, metadata=cv_meta)
 
-        return Coverage(service=self, metadata=cv_meta)
+        return self._coverages[key]
 
     def __getattr__(self, name):
         """Get coverage identified by name.
@@ -203,11 +268,30 @@ class WTSS:
     def __iter__(self):
         """Iterate over coverages available in the service.
 
+        The coverages metadata are retrieved concurrently, a few requests ahead
+        of the consumer, although they are yielded in the same order as the
+        names in :attr:`coverages`.
+
         Returns:
             A coverage at each iteration.
         """
-        for cv_name in self.coverages:
-            yield self[cv_name]
+        from concurrent.futures import ThreadPoolExecutor
+
+        names = iter(self.coverages)
+
+        with ThreadPoolExecutor(max_workers=_MAX_CONCURRENT_REQUESTS) as executor:
+            # Keep a bounded number of requests in flight, so that a consumer
+            # stopping early does not describe every coverage in the service.
+            pending = deque(executor.submit(self.__getitem__, name)
+                            for name in islice(names, _MAX_CONCURRENT_REQUESTS))
+
+            while pending:
+                cv = pending.popleft().result()
+
+                for name in islice(names, 1):
+                    pending.append(executor.submit(self.__getitem__, name))
+
+                yield cv
 
     def __str__(self):
         """Return the string representation of the WTSS object."""
@@ -270,8 +354,8 @@ class WTSS:
 
         url = '/'.join(s.strip('/') for s in url_components)
 
-        response = requests.get(url, params=params)
+        response = self._session.get(url, params=params)
 
         response.raise_for_status()
 
-        return response.json()
+        return _json_loads(response.content)